@@ -10,17 +10,82 @@ without contacting external services.
 from __future__ import annotations
 
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Final, Tuple
 
 from fastapi import Depends, FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+try:  # uvloop is unavailable on Windows; fall back to the default loop
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+from .http_client import close_async_client
 from .settings import get_settings, Settings
 from .valuation import compute_profit
 from .whatsapp import format_message, WhatsAppNotifier
 
-app = FastAPI(title="Golf Flip Monitor")
+
+@lru_cache(maxsize=1)
+def get_notifier() -> WhatsAppNotifier:
+    """Return the process-wide notifier so requests reuse its HTTP state."""
+    return WhatsAppNotifier(get_settings())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Manage process-wide resources such as the shared HTTP client."""
+    yield
+    await close_async_client()
+
+
+app = FastAPI(title="Golf Flip Monitor", lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Hard-coded sample listings for /dry-run, built once at import so the
+# endpoint does not reallocate them on every request
+_DRY_RUN_SAMPLES: Final[Tuple[Dict[str, Any], ...]] = (
+    {
+        "marketplace": "ebay",
+        "listing_id": "dry1",
+        "title": "Cobra King LTDx driver 9 deg with HC",
+        "url": "https://example.com/item1",
+        "brand": "Cobra",
+        "model": "King LTDx",
+        "condition": "excellent",
+        "price": 80.0,
+        "currency": "GBP",
+        "shipping_cost": 4.0,
+    },
+    {
+        "marketplace": "ebay",
+        "listing_id": "dry2",
+        "title": "Scotty Cameron Phantom X putter",
+        "url": "https://example.com/item2",
+        "brand": "Scotty Cameron",
+        "model": "Phantom X",
+        "condition": "very good",
+        "price": 200.0,
+        "currency": "GBP",
+        "shipping_cost": 5.0,
+    },
+    {
+        "marketplace": "vinted",
+        "listing_id": "dry3",
+        "title": "Junior set 7 piece",
+        "url": "https://example.com/item3",
+        "brand": None,
+        "model": None,
+        "condition": "good",
+        "price": 35.0,
+        "currency": "GBP",
+        "shipping_cost": 4.0,
+    },
+)
 
 
 @app.get("/health")
@@ -30,53 +95,17 @@ async def health() -> Dict[str, str]:
 
 
 @app.post("/dry-run")
-async def dry_run(settings: Settings = Depends(get_settings)) -> JSONResponse:
+async def dry_run(
+    settings: Settings = Depends(get_settings),
+    notifier: WhatsAppNotifier = Depends(get_notifier),
+) -> Dict[str, Any]:
     """Perform a dry-run using hard coded sample listings.
 
     This endpoint demonstrates message formatting and cost calculations.
     It returns the message text and payload for the first profitable item.
     """
-    samples: List[Dict[str, Any]] = [
-        {
-            "marketplace": "ebay",
-            "listing_id": "dry1",
-            "title": "Cobra King LTDx driver 9 deg with HC",
-            "url": "https://example.com/item1",
-            "brand": "Cobra",
-            "model": "King LTDx",
-            "condition": "excellent",
-            "price": 80.0,
-            "currency": "GBP",
-            "shipping_cost": 4.0,
-        },
-        {
-            "marketplace": "ebay",
-            "listing_id": "dry2",
-            "title": "Scotty Cameron Phantom X putter",
-            "url": "https://example.com/item2",
-            "brand": "Scotty Cameron",
-            "model": "Phantom X",
-            "condition": "very good",
-            "price": 200.0,
-            "currency": "GBP",
-            "shipping_cost": 5.0,
-        },
-        {
-            "marketplace": "vinted",
-            "listing_id": "dry3",
-            "title": "Junior set 7 piece",
-            "url": "https://example.com/item3",
-            "brand": None,
-            "model": None,
-            "condition": "good",
-            "price": 35.0,
-            "currency": "GBP",
-            "shipping_cost": 4.0,
-        },
-    ]
-    notifier = WhatsAppNotifier(settings)
     results = []
-    for listing in samples:
+    for listing in _DRY_RUN_SAMPLES:
         (
             product_cost,
             buyer_protection_cost,
@@ -121,7 +150,7 @@ async def dry_run(settings: Settings = Depends(get_settings)) -> JSONResponse:
         # Only show the first profitable message example
         if profit >= settings.PROFIT_MIN and margin_percent >= settings.MARGIN_MIN_PERCENT:
             break
-    # Return the first result or empty list if none
+    # Return the first result or a placeholder message if none
     if results:
-        return JSONResponse(content=results[0])
-    return JSONResponse(content={"message": "No profitable listings in dry run"})
+        return results[0]
+    return {"message": "No profitable listings in dry run"}
@@ -8,6 +8,11 @@ fetcher yields a list of simplified listing dictionaries that are
 suitable for further processing by the scoring and notification
 pipeline.
 
+Requests are issued asynchronously through the shared
+``httpx.AsyncClient`` from :mod:`golf_flip_app.http_client`, so network
+waits no longer block the event loop and multiple fetchers can run
+concurrently.
+
 The code here intentionally avoids making direct calls when API
 credentials are missing.  Instead, it returns an empty list so that
 tests and dry runs can proceed without external dependencies.
@@ -15,16 +20,48 @@ tests and dry runs can proceed without external dependencies.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import os
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, Final, List, Optional
 
-import requests
+import orjson
 
+from .http_client import get_async_client
 from .settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# OAuth token shared across EbayFetcher instances.  The expiry is a
+# time.monotonic() deadline with a 60 second safety margin so we refresh
+# shortly before the token actually lapses.
+_TOKEN_CACHE: Dict[str, Any] = {"token": None, "expiry": 0.0}
+_TOKEN_LOCK = asyncio.Lock()
+_TOKEN_EXPIRY_MARGIN = 60.0
+
+# Maximum in-flight Browse API searches per fetcher; the API tolerates
+# this level of concurrency comfortably
+_SEARCH_CONCURRENCY = 5
+
+# Query parameters that never vary between searches
+_STATIC_PARAMS: Final[Dict[str, str]] = {
+    "category_ids": "115280",  # Golf Clubs & Equipment
+    "limit": "50",
+    "sort": "newlyListed",
+}
+
+
+@lru_cache(maxsize=8)
+def _build_filter(max_price: Optional[float]) -> str:
+    """Build the Browse API filter string; MAX_PRICE rarely changes."""
+    filters: List[str] = []
+    if max_price is not None:
+        filters.append(f"price:[..{max_price}]")
+    # Only buy-it-now listings (fixed price)
+    filters.append("buyingOptions:{FIXED_PRICE}")
+    return " and ".join(filters)
+
 
 class EbayFetcher:
     """Client for fetching new listings from eBay via the Browse API."""
@@ -35,63 +72,95 @@ class EbayFetcher:
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self.session = requests.Session()
-        self._access_token: Optional[str] = None
+        self._search_sem = asyncio.Semaphore(_SEARCH_CONCURRENCY)
 
-    def _get_access_token(self) -> Optional[str]:
+    async def _get_access_token(self) -> Optional[str]:
         """Obtain an OAuth access token using the client credentials flow.
 
         Returns ``None`` if client credentials are not configured.  The token
-        is cached on the instance for reuse.
+        is cached at module level together with its expiry so that
+        short-lived fetcher instances do not re-request a token on every
+        poll cycle; the lock prevents concurrent fetches from racing to
+        refresh it.
         """
-        if self._access_token:
-            return self._access_token
+        if _TOKEN_CACHE["token"] and time.monotonic() < _TOKEN_CACHE["expiry"]:
+            return _TOKEN_CACHE["token"]
 
         client_id = self.settings.EBAY_CLIENT_ID
         client_secret = self.settings.EBAY_CLIENT_SECRET
         if not client_id or not client_secret:
             return None
-        # Perform client credentials request
-        try:
-            response = self.session.post(
-                self.TOKEN_ENDPOINT,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                data={
-                    "grant_type": "client_credentials",
-                    "scope": "https://api.ebay.com/oauth/api_scope",
-                },
-                auth=(client_id, client_secret),
-                timeout=10,
-            )
-            response.raise_for_status()
-            data = response.json()
-            self._access_token = data.get("access_token")
-            return self._access_token
-        except Exception as exc:
-            logger.warning("Failed to obtain eBay access token: %s", exc)
-            return None
+        async with _TOKEN_LOCK:
+            # Another coroutine may have refreshed the token while we waited
+            if _TOKEN_CACHE["token"] and time.monotonic() < _TOKEN_CACHE["expiry"]:
+                return _TOKEN_CACHE["token"]
+            # Perform client credentials request
+            try:
+                response = await get_async_client().post(
+                    self.TOKEN_ENDPOINT,
+                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                    data={
+                        "grant_type": "client_credentials",
+                        "scope": "https://api.ebay.com/oauth/api_scope",
+                    },
+                    auth=(client_id, client_secret),
+                )
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                expires_in = float(data.get("expires_in", 0.0))
+                _TOKEN_CACHE["token"] = data.get("access_token")
+                _TOKEN_CACHE["expiry"] = time.monotonic() + expires_in - _TOKEN_EXPIRY_MARGIN
+                return _TOKEN_CACHE["token"]
+            except Exception as exc:
+                logger.warning("Failed to obtain eBay access token: %s", exc)
+                return None
 
-    def _build_headers(self) -> Dict[str, str]:
+    async def _build_headers(self) -> Dict[str, str]:
         """Construct request headers for the Browse API."""
-        headers: Dict[str, str] = {
-            "User-Agent": "golf-flip-bot/1.0",
-            "X-EBAY-C-MARKETPLACE-ID": "EBAY_GB",
-        }
+        # User-Agent and keep-alive come from the shared client defaults
+        headers: Dict[str, str] = {"X-EBAY-C-MARKETPLACE-ID": "EBAY_GB"}
         # Use OAuth if available; otherwise pass AppID via header
-        token = self._get_access_token()
+        token = await self._get_access_token()
         if token:
             headers["Authorization"] = f"Bearer {token}"
         elif self.settings.EBAY_APP_ID:
             headers["X-EBAY-C-APP-ID"] = self.settings.EBAY_APP_ID
         return headers
 
-    def fetch_listings(self, keywords: List[str], max_price: Optional[float] = None) -> List[Dict[str, Any]]:
+    async def _fetch_one(
+        self, keyword: str, filter_str: str, headers: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        """Run a single keyword search, bounded by the search semaphore."""
+        params: Dict[str, Any] = {**_STATIC_PARAMS, "q": keyword, "filter": filter_str}
+        async with self._search_sem:
+            try:
+                response = await get_async_client().get(self.SEARCH_ENDPOINT, params=params, headers=headers)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except Exception as exc:
+                logger.error("Error querying eBay API for %r: %s", keyword, exc)
+                return []
+
+        items: List[Dict[str, Any]] = []
+        for item in data.get("itemSummaries", []):
+            try:
+                listing = self._simplify_item(item)
+                items.append(listing)
+            except Exception as exc:
+                logger.debug("Skipping item due to parse error: %s", exc)
+        return items
+
+    async def fetch_listings(self, keywords: List[str], max_price: Optional[float] = None) -> List[Dict[str, Any]]:
         """Search the eBay Browse API for items matching the given keywords.
 
+        One request is issued per keyword, fanned out concurrently behind
+        a semaphore, and the pages are merged with duplicates removed by
+        listing id.
+
         Parameters
         ----------
         keywords: List[str]
-            A list of search terms.  They will be combined with OR semantics.
+            A list of search terms.  They are combined with OR semantics.
         max_price: float, optional
             Maximum price filter.  Only items priced at or below this value
             (in the marketplace's default currency) will be returned.
@@ -106,40 +175,20 @@ class EbayFetcher:
             logger.info("Skipping eBay fetch – no API credentials configured")
             return []
 
-        query = "(" + ", ".join(keywords) + ")"
-        params: Dict[str, Any] = {
-            "q": query,
-            "category_ids": "115280",  # Golf Clubs & Equipment
-            "limit": "50",
-            "sort": "newlyListed",
-        }
-        # Apply price filter if specified
-        filters: List[str] = []
-        if max_price is not None:
-            filters.append(f"price:[..{max_price}]")
-        # Only buy-it-now listings (fixed price)
-        filters.append("buyingOptions:{FIXED_PRICE}")
-        if filters:
-            params["filter"] = " and ".join(filters)
-
-        headers = self._build_headers()
-
-        try:
-            response = self.session.get(self.SEARCH_ENDPOINT, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-        except Exception as exc:
-            logger.error("Error querying eBay API: %s", exc)
-            return []
-
-        items: List[Dict[str, Any]] = []
-        for item in data.get("itemSummaries", []):
-            try:
-                listing = self._simplify_item(item)
-                items.append(listing)
-            except Exception as exc:
-                logger.debug("Skipping item due to parse error: %s", exc)
-        return items
+        filter_str = _build_filter(max_price)
+        headers = await self._build_headers()
+        pages = await asyncio.gather(
+            *(self._fetch_one(keyword, filter_str, headers) for keyword in keywords)
+        )
+
+        # Merge pages, de-duplicating by listing id in one pass
+        merged: Dict[str, Dict[str, Any]] = {}
+        for page in pages:
+            for listing in page:
+                listing_id = listing.get("listing_id")
+                if listing_id and listing_id not in merged:
+                    merged[listing_id] = listing
+        return list(merged.values())
 
     def _simplify_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Extract relevant fields from a Browse API item summary."""
@@ -150,26 +199,21 @@ class EbayFetcher:
             # Grab the first available shipping cost
             shipping = shipping_options[0].get("shippingCost", {})
             shipping_cost = float(shipping.get("value")) if shipping.get("value") else None
+        # Build the aspect mapping once so each attribute is an O(1) lookup
+        aspects = {
+            aspect.get("name", "").lower(): (aspect.get("value") or [None])[0]
+            for aspect in item.get("itemSpecifics", {}).get("nameValueList", [])
+        }
         return {
             "marketplace": "ebay",
             "listing_id": item.get("itemId"),
             "title": item.get("title"),
             "url": item.get("itemWebUrl"),
-            "brand": self._get_attribute(item, "Brand"),
-            "model": self._get_attribute(item, "Model"),
+            "brand": aspects.get("brand"),
+            "model": aspects.get("model"),
             "condition": item.get("condition"),
             "price": float(price_info.get("value")) if price_info.get("value") else None,
             "currency": price_info.get("currency"),
             "shipping_cost": shipping_cost,
             "location": item.get("itemLocation", {}).get("postalCode"),
         }
-
-    @staticmethod
-    def _get_attribute(item: Dict[str, Any], name: str) -> Optional[str]:
-        """Extract a specific item attribute from the item summary."""
-        aspects = item.get("itemSpecifics", {}).get("nameValueList", [])
-        for aspect in aspects:
-            if aspect.get("name").lower() == name.lower():
-                values = aspect.get("value", [])
-                return values[0] if values else None
-        return None
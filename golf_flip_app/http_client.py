@@ -0,0 +1,53 @@
+"""
+Shared asynchronous HTTP client.
+
+Both marketplace fetchers issue their requests through a single
+``httpx.AsyncClient`` so that keep-alive connections and the HTTP/2
+session are reused across fetchers and polling cycles.  The client is
+created lazily on first use (inside a running event loop) and should be
+closed on shutdown via :func:`close_async_client` — the FastAPI lifespan
+handler and the worker entry point both do this.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+DEFAULT_TIMEOUT = 10.0
+CONNECT_RETRIES = 2
+
+# Default headers sent with every request so callers don't rebuild them.
+DEFAULT_HEADERS = {
+    "User-Agent": "golf-flip-bot/1.0",
+    "Connection": "keep-alive",
+}
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the process-wide ``httpx.AsyncClient``, creating it if needed."""
+    global _client
+    if _client is None or _client.is_closed:
+        # http2 and limits must go on the transport: httpx ignores the
+        # client-level kwargs when an explicit transport is supplied
+        _client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            headers=DEFAULT_HEADERS,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+                retries=CONNECT_RETRIES,
+            ),
+        )
+    return _client
+
+
+async def close_async_client() -> None:
+    """Close the shared client if it has been created."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
@@ -0,0 +1,20 @@
+"""
+Cached regular expression compilation.
+
+``re.compile`` already keeps a small internal cache, but it is capped
+and shared with every other regex in the process, so hot patterns can
+be evicted.  This module wraps compilation in an ``lru_cache`` of its
+own so the patterns used by the filtering pipeline stay compiled for
+the process lifetime regardless of what else compiles regexes.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def compile(pattern: str, flags: int = 0) -> re.Pattern:
+    """Return a compiled pattern, cached by (pattern, flags)."""
+    return re.compile(pattern, flags)
@@ -5,58 +5,120 @@ This module stores identifiers of listings that have already been processed
 so that the worker does not send duplicate notifications.  Each entry is
 keyed by a combination of marketplace and listing_id.  The timestamp
 records when the listing was first seen.
+
+The store keeps a single long-lived connection in WAL mode rather than
+opening one per call, and offers batch variants (``has_seen_many`` /
+``mark_seen_many``) so a whole page of listings costs one SQL round trip
+instead of one per item.
 """
 
 from __future__ import annotations
 
 import sqlite3
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Set, Tuple
+
+# SQLite limits the number of bound parameters per statement
+# (SQLITE_MAX_VARIABLE_NUMBER, 999 by default); stay well under it.
+_IN_CLAUSE_CHUNK = 500
 
 
 class SeenStore:
     """Persistent store for seen listings backed by SQLite."""
 
+    # SQL kept as class-level constants so identical statement strings
+    # hit the connection's prepared-statement cache on every call
+    _SQL_CREATE = """
+        CREATE TABLE IF NOT EXISTS seen (
+            marketplace TEXT NOT NULL,
+            listing_id TEXT NOT NULL,
+            seen_at INTEGER NOT NULL,
+            -- composite PK doubles as the covering index for the
+            -- (marketplace, listing_id) point lookups below
+            PRIMARY KEY (marketplace, listing_id)
+        )
+    """
+    _SQL_HAS_SEEN = "SELECT 1 FROM seen WHERE marketplace=? AND listing_id=? LIMIT 1"
+    _SQL_HAS_SEEN_MANY = "SELECT listing_id FROM seen WHERE marketplace=? AND listing_id IN ({placeholders})"
+    _SQL_INSERT = "INSERT OR IGNORE INTO seen (marketplace, listing_id, seen_at) VALUES (?, ?, ?)"
+
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
         # Ensure the parent directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None leaves the connection in autocommit mode so
+        # transactions are controlled explicitly (see mark_seen_many);
+        # the enlarged statement cache keeps the chunked IN(...) variants
+        # prepared alongside the fixed statements
+        self._conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-8000")  # 8 MB page cache
+        self._write_lock = threading.Lock()
         self._ensure_table()
 
     def _ensure_table(self) -> None:
         """Create the database table if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS seen (
-                    marketplace TEXT NOT NULL,
-                    listing_id TEXT NOT NULL,
-                    seen_at TEXT NOT NULL,
-                    PRIMARY KEY (marketplace, listing_id)
-                )
-                """
-            )
-            conn.commit()
+        self._conn.execute(self._SQL_CREATE)
+        self._conn.commit()
 
     def has_seen(self, marketplace: str, listing_id: str) -> bool:
         """Return True if this listing has already been processed."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM seen WHERE marketplace=? AND listing_id=?",
-                (marketplace, listing_id),
+        cursor = self._conn.execute(self._SQL_HAS_SEEN, (marketplace, listing_id))
+        return cursor.fetchone() is not None
+
+    def has_seen_many(self, marketplace: str, listing_ids: Iterable[str]) -> Set[str]:
+        """Return the subset of ``listing_ids`` already recorded as seen.
+
+        The lookup runs as one ``IN (?, ...)`` query per chunk of 500 ids
+        rather than one SELECT per listing.
+        """
+        ids: List[str] = list(listing_ids)
+        seen: Set[str] = set()
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK):
+            chunk = ids[start : start + _IN_CLAUSE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(
+                self._SQL_HAS_SEEN_MANY.format(placeholders=placeholders),
+                (marketplace, *chunk),
             )
-            return cursor.fetchone() is not None
+            seen.update(row[0] for row in cursor)
+        return seen
 
     def mark_seen(self, marketplace: str, listing_id: str) -> None:
-        """Mark a listing as seen with the current UTC timestamp."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO seen (marketplace, listing_id, seen_at) VALUES (?, ?, ?)",
-                (
-                    marketplace,
-                    listing_id,
-                    datetime.utcnow().isoformat(),
-                ),
-            )
-            conn.commit()
+        """Mark a listing as seen with the current epoch timestamp."""
+        self.mark_seen_many([(marketplace, listing_id)])
+
+    def mark_seen_many(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Mark many (marketplace, listing_id) pairs as seen in one batch.
+
+        All rows go through a single explicit transaction so the batch
+        costs one fsync instead of one per row.
+        """
+        # Store the epoch second directly: smaller rows than ISO strings
+        # and no datetime allocation or formatting on the hot path.
+        # SQLite's dynamic typing means pre-existing TEXT rows coexist fine.
+        seen_at = int(time.time())
+        rows = [(marketplace, listing_id, seen_at) for marketplace, listing_id in pairs]
+        if not rows:
+            return
+        with self._write_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(self._SQL_INSERT, rows)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._conn.close()
@@ -5,85 +5,139 @@ This module provides a lightweight configuration class that reads
 environment variables and exposes typed attributes.  The class is
 implemented without Pydantic to avoid dependency issues in restricted
 environments.  Defaults are sensible for local development.
+
+Environment reading happens in one sweep over a converter schema in
+:func:`get_settings` rather than per-field ``os.getenv`` calls;
+``Settings`` itself holds plain defaults so tests can construct
+instances directly without touching the environment.
 """
 
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Optional
-
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Final, List, Optional
 
-def _env_bool(name: str, default: bool = False) -> bool:
-    value = os.getenv(name)
-    if value is None:
-        return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+from . import regex_cache
 
 
-def _env_float(name: str, default: Optional[float] = None) -> Optional[float]:
-    value = os.getenv(name)
-    if value is None or value == "":
-        return default
-    try:
-        return float(value)
-    except ValueError:
-        return default
+def _to_bool(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
-def _env_int(name: str, default: int) -> int:
-    value = os.getenv(name)
-    if value is None:
-        return default
-    try:
-        return int(value)
-    except ValueError:
-        return default
+# Maps each environment variable to the converter applied to its raw
+# string value.  Converters raising ValueError fall back to the field
+# default, matching the old lenient _env_* helpers.
+_SCHEMA: Final[Dict[str, Callable[[str], Any]]] = {
+    "EBAY_APP_ID": str,
+    "EBAY_CLIENT_ID": str,
+    "EBAY_CLIENT_SECRET": str,
+    "EBAY_ENV": str,
+    "ENABLE_EBAY": _to_bool,
+    "ENABLE_VINTED": _to_bool,
+    "VINTED_REGION": str,
+    "WA_PHONE_ID": str,
+    "WA_TOKEN": str,
+    "RECIPIENT_PHONE": str,
+    "TWILIO_ACCOUNT_SID": str,
+    "TWILIO_AUTH_TOKEN": str,
+    "TWILIO_WHATSAPP_FROM": str,
+    "PROFIT_MIN": float,
+    "MARGIN_MIN_PERCENT": float,
+    "KEYWORDS": str,
+    "MAX_PRICE": float,
+    "REGEX_INCLUDE": str,
+    "REGEX_EXCLUDE": str,
+    "CURRENCY": str,
+    "POLL_INTERVAL": int,
+    "VALUATION_STRATEGY": str,
+    "SHIPPING_TABLE_JSON": str,
+    "SQLITE_DB": str,
+}
+
+
+def _load_env() -> Dict[str, Any]:
+    """Sweep the environment once, returning typed overrides for Settings."""
+    env = os.environ
+    values: Dict[str, Any] = {}
+    for name, convert in _SCHEMA.items():
+        raw = env.get(name)
+        if raw is None or raw == "":
+            continue
+        try:
+            values[name] = convert(raw)
+        except ValueError:
+            continue
+    return values
 
 
 @dataclass
 class Settings:
     """Configuration values loaded from environment variables."""
 
-    EBAY_APP_ID: Optional[str] = os.getenv("EBAY_APP_ID")
-    EBAY_CLIENT_ID: Optional[str] = os.getenv("EBAY_CLIENT_ID")
-    EBAY_CLIENT_SECRET: Optional[str] = os.getenv("EBAY_CLIENT_SECRET")
-    EBAY_ENV: str = os.getenv("EBAY_ENV", "PROD")
-
-    ENABLE_EBAY: bool = _env_bool("ENABLE_EBAY", True)
-    ENABLE_VINTED: bool = _env_bool("ENABLE_VINTED", False)
-    VINTED_REGION: str = os.getenv("VINTED_REGION", "uk")
-
-    WA_PHONE_ID: Optional[str] = os.getenv("WA_PHONE_ID")
-    WA_TOKEN: Optional[str] = os.getenv("WA_TOKEN")
-    RECIPIENT_PHONE: Optional[str] = os.getenv("RECIPIENT_PHONE")
-
-    TWILIO_ACCOUNT_SID: Optional[str] = os.getenv("TWILIO_ACCOUNT_SID")
-    TWILIO_AUTH_TOKEN: Optional[str] = os.getenv("TWILIO_AUTH_TOKEN")
-    TWILIO_WHATSAPP_FROM: Optional[str] = os.getenv("TWILIO_WHATSAPP_FROM")
-
-    PROFIT_MIN: float = _env_float("PROFIT_MIN", 10.0) or 10.0
-    MARGIN_MIN_PERCENT: float = _env_float("MARGIN_MIN_PERCENT", 20.0) or 20.0
-
-    KEYWORDS: str = os.getenv(
-        "KEYWORDS", "driver,putter,irons,Scotty Cameron,Cobra,Taylormade,Titleist"
-    )
-    MAX_PRICE: Optional[float] = _env_float("MAX_PRICE")
-    REGEX_INCLUDE: Optional[str] = os.getenv("REGEX_INCLUDE")
-    REGEX_EXCLUDE: Optional[str] = os.getenv("REGEX_EXCLUDE")
-
-    CURRENCY: str = os.getenv("CURRENCY", "GBP")
-    POLL_INTERVAL: int = _env_int("POLL_INTERVAL", 5)
-    VALUATION_STRATEGY: str = os.getenv("VALUATION_STRATEGY", "C")
-    SHIPPING_TABLE_JSON: Optional[str] = os.getenv("SHIPPING_TABLE_JSON")
-    SQLITE_DB: str = os.getenv("SQLITE_DB", "seen.db")
-
-
+    EBAY_APP_ID: Optional[str] = None
+    EBAY_CLIENT_ID: Optional[str] = None
+    EBAY_CLIENT_SECRET: Optional[str] = None
+    EBAY_ENV: str = "PROD"
+
+    ENABLE_EBAY: bool = True
+    ENABLE_VINTED: bool = False
+    VINTED_REGION: str = "uk"
+
+    WA_PHONE_ID: Optional[str] = None
+    WA_TOKEN: Optional[str] = None
+    RECIPIENT_PHONE: Optional[str] = None
+
+    TWILIO_ACCOUNT_SID: Optional[str] = None
+    TWILIO_AUTH_TOKEN: Optional[str] = None
+    TWILIO_WHATSAPP_FROM: Optional[str] = None
+
+    PROFIT_MIN: float = 10.0
+    MARGIN_MIN_PERCENT: float = 20.0
+
+    KEYWORDS: str = "driver,putter,irons,Scotty Cameron,Cobra,Taylormade,Titleist"
+    MAX_PRICE: Optional[float] = None
+    REGEX_INCLUDE: Optional[str] = None
+    REGEX_EXCLUDE: Optional[str] = None
+
+    CURRENCY: str = "GBP"
+    POLL_INTERVAL: int = 5
+    VALUATION_STRATEGY: str = "C"
+    SHIPPING_TABLE_JSON: Optional[str] = None
+    SQLITE_DB: str = "seen.db"
+
+    # Derived values, parsed/compiled once per Settings instance so hot
+    # paths never re-split keywords or re-compile regexes
+    keywords_list: List[str] = field(init=False, repr=False)
+    include_re: Optional[re.Pattern] = field(init=False, repr=False)
+    exclude_re: Optional[re.Pattern] = field(init=False, repr=False)
+    currency_symbol: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.currency_symbol = "£" if self.CURRENCY.upper() == "GBP" else f"{self.CURRENCY} "
+        self.keywords_list = [kw.strip() for kw in self.KEYWORDS.split(",") if kw.strip()]
+        # regex_cache keeps these compiled across Settings instances, so
+        # tests constructing many Settings never recompile a pattern
+        self.include_re = (
+            regex_cache.compile(self.REGEX_INCLUDE, re.IGNORECASE)
+            if self.REGEX_INCLUDE
+            else None
+        )
+        self.exclude_re = (
+            regex_cache.compile(self.REGEX_EXCLUDE, re.IGNORECASE)
+            if self.REGEX_EXCLUDE
+            else None
+        )
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Factory function to create a new Settings instance.
+    """Return the process-wide Settings instance.
 
-    Using a function rather than a global instance ensures environment
-    variables are read each time the settings are needed, which is
-    useful for testing and dynamic reloads.
+    The instance is cached for the process lifetime since environment
+    variables do not change under a running worker; tests that need to
+    re-read the environment can call ``get_settings.cache_clear()``.
     """
-    return Settings()
+    return Settings(**_load_env())
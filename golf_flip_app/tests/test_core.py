@@ -1,17 +1,19 @@
 """
 Unit tests for cost and profit computation and message formatting.
 
-These tests exercise the valuation logic and the notifier formatting
-helpers to ensure values are calculated correctly and messages are
-assembled as expected.
+These tests exercise the valuation logic, the batch valuation and
+seen-store APIs used on the worker hot path, and the notifier
+formatting helpers to ensure values are calculated correctly and
+messages are assembled as expected.
 """
 
 from __future__ import annotations
 
 import re
 
+from golf_flip_app.seen_store import SeenStore
 from golf_flip_app.settings import Settings
-from golf_flip_app.valuation import compute_profit
+from golf_flip_app.valuation import compute_profit, compute_profit_batch
 from golf_flip_app.whatsapp import format_message
 
 
@@ -40,6 +42,54 @@ def test_compute_profit_heuristic() -> None:
     assert margin_percent == 36.36
 
 
+def test_compute_profit_batch_matches_scalar() -> None:
+    settings = Settings(VALUATION_STRATEGY="C")
+    listings = [
+        {"price": 100.0, "shipping_cost": 5.0},
+        {"price": 13.70, "shipping_cost": 3.0},
+        {"price": 42.0},
+    ]
+    breakdowns = compute_profit_batch(listings, settings)
+    # Same length, same order, same values as the per-listing API
+    assert len(breakdowns) == len(listings)
+    assert breakdowns == [compute_profit(listing, settings) for listing in listings]
+    # Pin the vectorized rounding on a half-cent boundary: 5% of 13.70
+    assert breakdowns[1] == (13.7, 0.68, 3.0, 17.38, 20.55, 3.17, 18.24)
+
+
+def test_compute_profit_batch_fallbacks() -> None:
+    settings = Settings(VALUATION_STRATEGY="C")
+    breakdowns = compute_profit_batch(
+        [
+            {"price": None},  # no price -> no resale estimate
+            {"price": 100.0},  # no shipping info and no table
+        ],
+        settings,
+    )
+    # Unpriced listings yield an all-zero breakdown rather than NaNs
+    assert breakdowns[0] == (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    # Missing shipping falls back to 0.0 and the rest is computed
+    assert breakdowns[1] == (100.0, 5.0, 0.0, 105.0, 150.0, 45.0, 42.86)
+    assert compute_profit_batch([], settings) == []
+
+
+def test_seen_store_batch_roundtrip(tmp_path) -> None:
+    store = SeenStore(str(tmp_path / "seen.db"))
+    try:
+        # More ids than one IN(...) chunk holds, to cover the chunked path
+        ids = [f"id-{i}" for i in range(1200)]
+        assert store.has_seen_many("ebay", ids) == set()
+        store.mark_seen_many([("ebay", listing_id) for listing_id in ids])
+        assert store.has_seen_many("ebay", ids + ["unknown"]) == set(ids)
+        # Re-marking existing pairs is a no-op (INSERT OR IGNORE)
+        store.mark_seen_many([("ebay", "id-0"), ("ebay", "brand-new")])
+        assert store.has_seen("ebay", "brand-new")
+        # Pairs are scoped per marketplace
+        assert store.has_seen_many("vinted", ids[:3]) == set()
+    finally:
+        store.close()
+
+
 def test_format_message_structure() -> None:
     settings = Settings(CURRENCY="GBP", PROFIT_MIN=10)
     listing = {
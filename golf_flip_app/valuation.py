@@ -11,10 +11,20 @@ from __future__ import annotations
 import json
 import statistics
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from .settings import Settings
 
+try:  # Numba is optional; the NumPy path below is used when unavailable
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Flat buyer-protection fee applied in lieu of marketplace-specific rules
+BUYER_PROTECTION_RATE = 0.05
+
 
 def compute_buyer_protection_cost(price: float, settings: Settings) -> float:
     """Compute the buyer protection cost.
@@ -37,7 +47,7 @@ def compute_buyer_protection_cost(price: float, settings: Settings) -> float:
     float
         Buyer protection cost, rounded to two decimal places.
     """
-    cost = price * 0.05
+    cost = price * BUYER_PROTECTION_RATE
     return round(cost, 2)
 
 
@@ -118,11 +128,175 @@ def estimate_resale_value(listing: Dict[str, Any], settings: Settings) -> Option
         raise ValueError(f"Unknown valuation strategy: {strategy}")
 
 
-def compute_profit(listing: Dict[str, Any], settings: Settings) -> Tuple[float, float, float, float, float]:
-    """Calculate cost breakdown and profit for a listing.
+def _profit_kernel_numpy(
+    product_cost: "np.ndarray", shipping_cost: "np.ndarray", resale_value: "np.ndarray"
+) -> Tuple["np.ndarray", ...]:
+    """Vectorized profit arithmetic shared by the batch API.
+
+    Takes float64 arrays of prices, shipping costs and resale values
+    (NaN where no resale estimate exists) and returns the seven cost
+    columns in breakdown order.
+    """
+    count = product_cost.shape[0]
+    product_cost = np.round(product_cost, 2)
+    buyer_protection_cost = np.round(product_cost * BUYER_PROTECTION_RATE, 2)
+    shipping_cost = np.round(shipping_cost, 2)
+    total_cost = np.round(product_cost + buyer_protection_cost + shipping_cost, 2)
+    profit = np.round(resale_value - total_cost, 2)
+    margin_percent = np.round(
+        np.divide(
+            profit * 100.0,
+            total_cost,
+            out=np.zeros(count, dtype=np.float64),
+            where=total_cost != 0.0,
+        ),
+        2,
+    )
+    # Listings without an estimable resale value yield zero profit/margin
+    no_resale = np.isnan(resale_value)
+    resale_value = np.where(no_resale, 0.0, resale_value)
+    profit = np.where(no_resale, 0.0, profit)
+    margin_percent = np.where(no_resale, 0.0, margin_percent)
+    return (
+        product_cost,
+        buyer_protection_cost,
+        shipping_cost,
+        total_cost,
+        resale_value,
+        profit,
+        margin_percent,
+    )
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _profit_kernel(
+        product_cost: "np.ndarray", shipping_cost: "np.ndarray", resale_value: "np.ndarray"
+    ) -> Tuple["np.ndarray", ...]:
+        """JIT-compiled scalar loop equivalent of :func:`_profit_kernel_numpy`."""
+        count = product_cost.shape[0]
+        out_product = np.empty(count)
+        out_protection = np.empty(count)
+        out_shipping = np.empty(count)
+        out_total = np.empty(count)
+        out_resale = np.empty(count)
+        out_profit = np.empty(count)
+        out_margin = np.empty(count)
+        for i in range(count):
+            price = round(product_cost[i], 2)
+            protection = round(price * BUYER_PROTECTION_RATE, 2)
+            shipping = round(shipping_cost[i], 2)
+            total = round(price + protection + shipping, 2)
+            resale = resale_value[i]
+            if np.isnan(resale):
+                resale = 0.0
+                profit = 0.0
+                margin = 0.0
+            else:
+                profit = round(resale - total, 2)
+                margin = round(profit * 100.0 / total, 2) if total != 0.0 else 0.0
+            out_product[i] = price
+            out_protection[i] = protection
+            out_shipping[i] = shipping
+            out_total[i] = total
+            out_resale[i] = resale
+            out_profit[i] = profit
+            out_margin[i] = margin
+        return (
+            out_product,
+            out_protection,
+            out_shipping,
+            out_total,
+            out_resale,
+            out_profit,
+            out_margin,
+        )
+
+    # Warm-compile on a one-element batch so the first real page of
+    # listings does not pay the JIT cost
+    _profit_kernel(np.zeros(1), np.zeros(1), np.full(1, np.nan))
+else:
+    _profit_kernel = _profit_kernel_numpy
+
+
+def compute_profit_batch(
+    listings: List[Dict[str, Any]], settings: Settings
+) -> List[Tuple[float, float, float, float, float, float, float]]:
+    """Calculate cost breakdowns and profits for a batch of listings.
+
+    The arithmetic runs on NumPy arrays (JIT-compiled with Numba when it
+    is installed) so a page of listings costs a handful of vectorized
+    operations instead of per-listing Python math.
+    Shipping and resale lookups remain per listing because they depend on
+    listing-specific tables and strategies.
+
+    Parameters
+    ----------
+    listings: list of dict
+        Listing dictionaries from a fetcher.
+    settings: Settings
+        Application configuration.
+
+    Returns
+    -------
+    list of tuple
+        One (product_cost, buyer_protection_cost, shipping_cost,
+        total_cost, potential_resale_value, profit, margin_percent)
+        tuple per listing, in input order.
+    """
+    count = len(listings)
+    if count == 0:
+        return []
+    product_cost = np.fromiter(
+        (float(listing.get("price") or 0.0) for listing in listings),
+        dtype=np.float64,
+        count=count,
+    )
+    shipping_lookups = [lookup_shipping_cost(listing, settings) for listing in listings]
+    shipping_cost = np.fromiter(
+        (cost if cost is not None else 0.0 for cost in shipping_lookups),
+        dtype=np.float64,
+        count=count,
+    )
+    resale_lookups = [estimate_resale_value(listing, settings) for listing in listings]
+    resale_value = np.fromiter(
+        (value if value is not None else np.nan for value in resale_lookups),
+        dtype=np.float64,
+        count=count,
+    )
+
+    (
+        product_cost,
+        buyer_protection_cost,
+        shipping_cost,
+        total_cost,
+        resale_value,
+        profit,
+        margin_percent,
+    ) = _profit_kernel(product_cost, shipping_cost, resale_value)
+
+    return list(
+        zip(
+            product_cost.tolist(),
+            buyer_protection_cost.tolist(),
+            shipping_cost.tolist(),
+            total_cost.tolist(),
+            resale_value.tolist(),
+            profit.tolist(),
+            margin_percent.tolist(),
+        )
+    )
+
+
+def compute_profit(
+    listing: Dict[str, Any], settings: Settings
+) -> Tuple[float, float, float, float, float, float, float]:
+    """Calculate cost breakdown and profit for a single listing.
 
     The returned tuple contains (product_cost, buyer_protection_cost,
     shipping_cost, total_cost, potential_resale_value, profit, margin_percent).
+    This is a thin wrapper over :func:`compute_profit_batch`.
 
     Parameters
     ----------
@@ -136,25 +310,4 @@ def compute_profit(listing: Dict[str, Any], settings: Settings) -> Tuple[float,
     tuple
         Tuple with cost breakdown and profit metrics.
     """
-    product_cost = round(float(listing.get("price", 0.0)), 2)
-    buyer_protection_cost = compute_buyer_protection_cost(product_cost, settings)
-    shipping_cost = lookup_shipping_cost(listing, settings)
-    total_cost = product_cost + buyer_protection_cost
-    if shipping_cost is not None:
-        total_cost += shipping_cost
-    potential_resale_value = estimate_resale_value(listing, settings)
-    if potential_resale_value is None:
-        profit = 0.0
-        margin_percent = 0.0
-    else:
-        profit = round(potential_resale_value - total_cost, 2)
-        margin_percent = round((profit / total_cost) * 100, 2) if total_cost else 0.0
-    return (
-        round(product_cost, 2),
-        round(buyer_protection_cost, 2),
-        round(shipping_cost, 2) if shipping_cost is not None else 0.0,
-        round(total_cost, 2),
-        round(potential_resale_value, 2) if potential_resale_value is not None else 0.0,
-        round(profit, 2),
-        round(margin_percent, 2),
-    )
+    return compute_profit_batch([listing], settings)[0]
@@ -5,21 +5,29 @@ Vinted does not expose a public, stable API.  Community members have
 reverse-engineered certain endpoints, but these are unofficial and
 subject to change without notice.  This module provides a minimal
 fetcher that queries the current JSON endpoints used by the Vinted
-website.  Use at your own risk and disable via ``ENABLE_VINTED`` if
-these calls stop working.
+website.  Requests go through the shared ``httpx.AsyncClient`` from
+:mod:`golf_flip_app.http_client` so they can run concurrently with the
+eBay fetcher.  Use at your own risk and disable via ``ENABLE_VINTED``
+if these calls stop working.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
-import requests
+import orjson
 
+from .http_client import get_async_client
 from .settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Maximum in-flight catalogue searches; keep this modest since the
+# endpoint is unofficial
+_SEARCH_CONCURRENCY = 5
+
 
 class VintedFetcher:
     """Client for fetching new listings from Vinted.
@@ -35,15 +43,51 @@ class VintedFetcher:
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self.session = requests.Session()
+        self._search_sem = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+
+    async def _fetch_one(
+        self, base_url: str, keyword: str, max_price: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """Run a single keyword search, bounded by the search semaphore."""
+        params: Dict[str, Any] = {
+            "search_text": keyword,
+            "page": 1,
+            "per_page": 50,
+            "order": "newest_first",
+        }
+        if max_price is not None:
+            params["price_to"] = int(max_price)
+
+        async with self._search_sem:
+            try:
+                response = await get_async_client().get(base_url, params=params)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except Exception as exc:
+                logger.error("Error querying Vinted API for %r: %s", keyword, exc)
+                return []
 
-    def fetch_listings(self, keywords: List[str], max_price: Optional[float] = None) -> List[Dict[str, Any]]:
+        items: List[Dict[str, Any]] = []
+        for item in data.get("items", []):
+            try:
+                listing = self._simplify_item(item)
+                items.append(listing)
+            except Exception as exc:
+                logger.debug("Skipping Vinted item due to parse error: %s", exc)
+        return items
+
+    async def fetch_listings(self, keywords: List[str], max_price: Optional[float] = None) -> List[Dict[str, Any]]:
         """Fetch the newest listings from Vinted matching the keywords.
 
+        One catalogue search is issued per keyword, fanned out
+        concurrently behind a semaphore, and the pages are merged with
+        duplicates removed by listing id.
+
         Parameters
         ----------
         keywords: List[str]
-            Terms to search for.  They are combined with spaces (AND semantics).
+            Terms to search for.  Each is searched independently and the
+            results combined (OR semantics).
         max_price: float, optional
             Maximum price filter.  Only items priced at or below this value
             will be returned.
@@ -58,32 +102,19 @@ class VintedFetcher:
             return []
         region = self.settings.VINTED_REGION.lower().strip()
         base_url = self.BASE_URL_TEMPLATE.format(region=region)
-        query = " ".join(keywords)
-        params: Dict[str, Any] = {
-            "search_text": query,
-            "page": 1,
-            "per_page": 50,
-            "order": "newest_first",
-        }
-        if max_price is not None:
-            params["price_to"] = int(max_price)
 
-        try:
-            response = self.session.get(base_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-        except Exception as exc:
-            logger.error("Error querying Vinted API: %s", exc)
-            return []
-
-        items: List[Dict[str, Any]] = []
-        for item in data.get("items", []):
-            try:
-                listing = self._simplify_item(item)
-                items.append(listing)
-            except Exception as exc:
-                logger.debug("Skipping Vinted item due to parse error: %s", exc)
-        return items
+        pages = await asyncio.gather(
+            *(self._fetch_one(base_url, keyword, max_price) for keyword in keywords)
+        )
+
+        # Merge pages, de-duplicating by listing id in one pass
+        merged: Dict[str, Dict[str, Any]] = {}
+        for page in pages:
+            for listing in page:
+                listing_id = listing.get("listing_id")
+                if listing_id and listing_id not in merged:
+                    merged[listing_id] = listing
+        return list(merged.values())
 
     def _simplify_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Extract relevant fields from a Vinted item record."""
@@ -11,19 +11,42 @@ from __future__ import annotations
 import logging
 from typing import Dict, Tuple
 
-import requests
+import httpx
+import orjson
 
 from .settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Verdict lines as module constants so each call references an already
+# built (and interned) string instead of decoding escape sequences
+_MSG_GOOD = "\U0001f7e2 Looks good!"
+_MSG_BAD = "\U0001f7e4 Not profitable enough"
+
+# Message layout shared by every notification; only the values vary
+_MESSAGE_TEMPLATE = (
+    "Title: {title}\n"
+    "Link: {url}\n"
+    "Condition: {condition}\n\n"
+    "Costs\n"
+    "Product: {sym}{product_cost:.2f}\n"
+    "Buyer protection: {sym}{buyer_protection_cost:.2f}\n"
+    "Shipping: {sym}{shipping_cost:.2f}\n"
+    "Total: {sym}{total_cost:.2f}\n\n"
+    "Value\n"
+    "Potential resale: {sym}{potential_resale_value:.2f}\n"
+    "Profit: {sym}{profit:.2f}  ({margin_percent:.2f}% )\n\n"
+    "{verdict}"
+)
+
 
 def format_message(listing: Dict[str, str], breakdown: Tuple[float, float, float, float, float, float, float], settings: Settings) -> str:
     """Construct the WhatsApp notification text.
 
     The message includes the title, URL, condition, cost breakdown and
     potential resale value.  Values are formatted to two decimal
-    places and use the configured currency.
+    places and use the configured currency.  The layout lives in a
+    module-level template so each call only substitutes values.
     """
     (
         product_cost,
@@ -34,22 +57,20 @@ def format_message(listing: Dict[str, str], breakdown: Tuple[float, float, float
         profit,
         margin_percent,
     ) = breakdown
-    currency_symbol = "\u00a3" if settings.CURRENCY.upper() == "GBP" else settings.CURRENCY + " "
-    message = (
-        f"Title: {listing['title']}\n"
-        f"Link: {listing['url']}\n"
-        f"Condition: {listing.get('condition', 'Unknown')}\n\n"
-        f"Costs\n"
-        f"Product: {currency_symbol}{product_cost:.2f}\n"
-        f"Buyer protection: {currency_symbol}{buyer_protection_cost:.2f}\n"
-        f"Shipping: {currency_symbol}{shipping_cost:.2f}\n"
-        f"Total: {currency_symbol}{total_cost:.2f}\n\n"
-        f"Value\n"
-        f"Potential resale: {currency_symbol}{potential_resale_value:.2f}\n"
-        f"Profit: {currency_symbol}{profit:.2f}  ({margin_percent:.2f}% )\n\n"
-        f"{'\ud83d\udd35 Looks good!' if profit >= settings.PROFIT_MIN else '\ud83d\udfe4 Not profitable enough'}"
+    return _MESSAGE_TEMPLATE.format(
+        title=listing["title"],
+        url=listing["url"],
+        condition=listing.get("condition", "Unknown"),
+        sym=settings.currency_symbol,
+        product_cost=product_cost,
+        buyer_protection_cost=buyer_protection_cost,
+        shipping_cost=shipping_cost,
+        total_cost=total_cost,
+        potential_resale_value=potential_resale_value,
+        profit=profit,
+        margin_percent=margin_percent,
+        verdict=_MSG_GOOD if profit >= settings.PROFIT_MIN else _MSG_BAD,
     )
-    return message
 
 
 class WhatsAppNotifier:
@@ -60,6 +81,37 @@ class WhatsAppNotifier:
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # One HTTP/2 client for all sends: keep-alive avoids a fresh
+        # TCP+TLS handshake per notification and multiplexing lets a
+        # burst of sends share a single connection; transport retries
+        # cover transient connect failures
+        # http2 and limits must go on the transport: httpx ignores the
+        # client-level kwargs when an explicit transport is supplied
+        self._client = httpx.Client(
+            timeout=10.0,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                retries=2,
+            ),
+        )
+        # Constant per-provider pieces, built once instead of per send
+        self._cloud_url = self.GRAPH_ENDPOINT_TEMPLATE.format(phone_id=settings.WA_PHONE_ID)
+        self._cloud_headers = {
+            "Authorization": f"Bearer {settings.WA_TOKEN}",
+            "Content-Type": "application/json",
+        }
+        self._cloud_base = {
+            "messaging_product": "whatsapp",
+            "to": settings.RECIPIENT_PHONE,
+            "type": "text",
+        }
+        self._twilio_url = self.TWILIO_ENDPOINT_TEMPLATE.format(
+            account_sid=settings.TWILIO_ACCOUNT_SID
+        )
+        self._twilio_auth = (settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+        self._twilio_from = f"whatsapp:{settings.TWILIO_WHATSAPP_FROM}"
+        self._twilio_to = f"whatsapp:{settings.RECIPIENT_PHONE}"
 
     def send(self, message: str) -> bool:
         """Send a WhatsApp message using the configured provider.
@@ -83,19 +135,15 @@ class WhatsAppNotifier:
         return False
 
     def _send_cloud(self, message: str) -> bool:
-        url = self.GRAPH_ENDPOINT_TEMPLATE.format(phone_id=self.settings.WA_PHONE_ID)
-        payload = {
-            "messaging_product": "whatsapp",
-            "to": self.settings.RECIPIENT_PHONE,
-            "type": "text",
-            "text": {"preview_url": False, "body": message},
-        }
-        headers = {
-            "Authorization": f"Bearer {self.settings.WA_TOKEN}",
-            "Content-Type": "application/json",
-        }
+        # Serialize once with orjson rather than letting the client run
+        # stdlib json.dumps on every send (and on every retry)
+        body = orjson.dumps(
+            {**self._cloud_base, "text": {"preview_url": False, "body": message}}
+        )
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = self._client.post(
+                self._cloud_url, content=body, headers=self._cloud_headers
+            )
             resp.raise_for_status()
             return True
         except Exception as exc:
@@ -103,18 +151,16 @@ class WhatsAppNotifier:
             return False
 
     def _send_twilio(self, message: str) -> bool:
-        url = self.TWILIO_ENDPOINT_TEMPLATE.format(account_sid=self.settings.TWILIO_ACCOUNT_SID)
         data = {
-            "From": f"whatsapp:{self.settings.TWILIO_WHATSAPP_FROM}",
-            "To": f"whatsapp:{self.settings.RECIPIENT_PHONE}",
+            "From": self._twilio_from,
+            "To": self._twilio_to,
             "Body": message,
         }
         try:
-            resp = requests.post(
-                url,
+            resp = self._client.post(
+                self._twilio_url,
                 data=data,
-                auth=(self.settings.TWILIO_ACCOUNT_SID, self.settings.TWILIO_AUTH_TOKEN),
-                timeout=10,
+                auth=self._twilio_auth,
             )
             resp.raise_for_status()
             return True
@@ -10,43 +10,92 @@ individual marketplaces and can be run either once or continuously.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 import sys
-from datetime import datetime
-from typing import List
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
 
+import numpy as np
+import orjson
+
+from .http_client import close_async_client
 from .settings import get_settings, Settings
 from .seen_store import SeenStore
 from .ebay_fetcher import EbayFetcher
 from .vinted_fetcher import VintedFetcher
 from .whatsapp import WhatsAppNotifier, format_message
-from .valuation import compute_profit
+from .valuation import compute_profit_batch
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s %(message)s")
 
 
-def parse_keywords(keyword_str: str) -> List[str]:
-    return [kw.strip() for kw in keyword_str.split(",") if kw.strip()]
+# Conditions worth buying; frozenset gives an O(1) membership test
+_ACCEPTABLE_CONDITIONS = frozenset({"new", "like new", "excellent", "very good", "good"})
+
+# Listing fields copied verbatim into the logged payload, and the cost
+# breakdown fields in the order compute_profit_batch returns them
+_LOG_FIELDS = ("title", "url", "brand", "model", "condition")
+_COST_FIELDS = (
+    "product_cost",
+    "buyer_protection_cost",
+    "shipping_cost",
+    "total_cost",
+    "potential_resale_value",
+    "profit",
+    "margin_percent",
+)
 
 
 def condition_acceptable(condition: str) -> bool:
-    if not condition:
-        return False
-    acceptable = ["new", "like new", "excellent", "very good", "good"]
-    return condition.lower() in acceptable
+    return bool(condition) and condition.lower() in _ACCEPTABLE_CONDITIONS
 
 
-async def run_once(settings: Settings) -> None:
-    """Perform a single polling cycle across enabled marketplaces."""
-    seen_store = SeenStore(settings.SQLITE_DB)
-    notifier = WhatsAppNotifier(settings)
-    keywords = parse_keywords(settings.KEYWORDS)
+async def _notification_sender(notifier: WhatsAppNotifier, queue: asyncio.Queue) -> None:
+    """Drain queued messages so HTTP sends stay off the polling path."""
+    while True:
+        message = await queue.get()
+        try:
+            if await asyncio.to_thread(notifier.send, message):
+                logger.info("Notification sent")
+        except Exception as exc:
+            logger.error("Notification send failed: %s", exc)
+        finally:
+            queue.task_done()
+
+
+async def run_once(
+    settings: Settings,
+    keywords: Optional[List[str]] = None,
+    regex_include: Optional[re.Pattern] = None,
+    regex_exclude: Optional[re.Pattern] = None,
+    send_queue: Optional[asyncio.Queue] = None,
+    seen_store: Optional[SeenStore] = None,
+    notifier: Optional[WhatsAppNotifier] = None,
+) -> None:
+    """Perform a single polling cycle across enabled marketplaces.
+
+    The keyword list, compiled regex filters, seen store and notifier
+    can all be passed in by a long-running caller (see
+    :func:`start_worker`) so each cycle starts with zero rebuild work;
+    they default to the precompiled values on ``settings`` and to
+    freshly constructed helpers for one-shot callers.
+    """
+    if seen_store is None:
+        seen_store = SeenStore(settings.SQLITE_DB)
+    if notifier is None and send_queue is None:
+        # Only needed for inline sends; queued sends go through the
+        # caller's background sender
+        notifier = WhatsAppNotifier(settings)
+    if keywords is None:
+        keywords = settings.keywords_list
+    if regex_include is None:
+        regex_include = settings.include_re
+    if regex_exclude is None:
+        regex_exclude = settings.exclude_re
     max_price = settings.MAX_PRICE
-    regex_include = re.compile(settings.REGEX_INCLUDE, re.IGNORECASE) if settings.REGEX_INCLUDE else None
-    regex_exclude = re.compile(settings.REGEX_EXCLUDE, re.IGNORECASE) if settings.REGEX_EXCLUDE else None
 
     fetchers = []
     if settings.ENABLE_EBAY:
@@ -54,95 +103,149 @@ async def run_once(settings: Settings) -> None:
     if settings.ENABLE_VINTED:
         fetchers.append(VintedFetcher(settings))
 
-    for fetcher in fetchers:
-        try:
-            listings = fetcher.fetch_listings(keywords, max_price)
-        except Exception as exc:
-            logger.error("Fetcher error: %s", exc)
+    # Fetch from all marketplaces concurrently; network waits overlap
+    results = await asyncio.gather(
+        *(fetcher.fetch_listings(keywords, max_price) for fetcher in fetchers),
+        return_exceptions=True,
+    )
+    # One timestamp per cycle; every payload this cycle shares it rather
+    # than paying a datetime allocation and format per listing
+    cycle_ts = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    # (marketplace, listing_id) pairs processed this cycle, flushed once
+    processed_pairs: List[tuple] = []
+    for fetcher, listings in zip(fetchers, results):
+        if isinstance(listings, BaseException):
+            logger.error("%s error: %s", type(fetcher).__name__, listings)
             continue
-        for listing in listings:
-            marketplace = listing["marketplace"]
-            listing_id = listing["listing_id"]
-            if not listing_id:
-                continue
-            if seen_store.has_seen(marketplace, listing_id):
-                continue
-            title = listing.get("title", "")
-            # apply regex include/exclude filters
-            if regex_include and not regex_include.search(title):
-                continue
-            if regex_exclude and regex_exclude.search(title):
+        # De-duplicate by listing id while dropping id-less entries, so
+        # the batch stays unique even if a fetcher returns overlapping
+        # pages; dict comprehension keeps it a single O(n) pass
+        candidates = list(
+            {
+                listing["listing_id"]: listing
+                for listing in listings
+                if listing.get("listing_id")
+            }.values()
+        )
+        if not candidates:
+            continue
+        # One batched lookup per fetcher instead of one SELECT per listing
+        marketplace = candidates[0]["marketplace"]
+        seen_ids = seen_store.has_seen_many(
+            marketplace, [listing["listing_id"] for listing in candidates]
+        )
+        # Apply the cheap filters to the unseen subset only, cheapest
+        # first: set membership, then the condition lookup, then the
+        # regex scans.  Bound methods are hoisted so the per-listing
+        # branches cost one truthiness check, not an attribute lookup.
+        search_include = regex_include.search if regex_include else None
+        search_exclude = regex_exclude.search if regex_exclude else None
+        new_listings = []
+        for listing in candidates:
+            if listing["listing_id"] in seen_ids:
                 continue
-            # skip if condition unacceptable
             cond = listing.get("condition") or ""
             if cond and not condition_acceptable(cond):
                 continue
-            # compute cost and profit
-            (
-                product_cost,
-                buyer_protection_cost,
-                shipping_cost,
-                total_cost,
-                potential_resale_value,
-                profit,
-                margin_percent,
-            ) = compute_profit(listing, settings)
-            # Determine if meets thresholds
-            if profit < settings.PROFIT_MIN or margin_percent < settings.MARGIN_MIN_PERCENT:
-                # do not notify but mark seen to avoid re-processing low-profit items
-                seen_store.mark_seen(marketplace, listing_id)
+            title = listing.get("title", "")
+            if search_include and not search_include(title):
                 continue
-            # send message
-            message = format_message(
-                listing,
-                (
-                    product_cost,
-                    buyer_protection_cost,
-                    shipping_cost,
-                    total_cost,
-                    potential_resale_value,
-                    profit,
-                    margin_percent,
-                ),
-                settings,
-            )
-            if notifier.send(message):
+            if search_exclude and search_exclude(title):
+                continue
+            new_listings.append(listing)
+        if not new_listings:
+            continue
+        # One vectorized valuation pass over the surviving listings
+        breakdowns = compute_profit_batch(new_listings, settings)
+        # Mark everything seen whether or not we notify, so low-profit
+        # items are not re-processed on the next cycle
+        processed_pairs.extend(
+            (marketplace, listing["listing_id"]) for listing in new_listings
+        )
+        # Vectorized threshold check: the Python loop below only runs
+        # over listings that actually qualify for a notification
+        profits = np.fromiter(
+            (b[5] for b in breakdowns), dtype=np.float64, count=len(breakdowns)
+        )
+        margins = np.fromiter(
+            (b[6] for b in breakdowns), dtype=np.float64, count=len(breakdowns)
+        )
+        qualified = np.flatnonzero(
+            (profits >= settings.PROFIT_MIN) & (margins >= settings.MARGIN_MIN_PERCENT)
+        )
+        for index in qualified:
+            listing = new_listings[index]
+            breakdown = breakdowns[index]
+            listing_id = listing["listing_id"]
+            # send message; enqueue when a background sender is running so
+            # the cycle never blocks on notification round trips
+            message = format_message(listing, breakdown, settings)
+            if send_queue is not None:
+                await send_queue.put(message)
+                logger.info("Notification queued for %s %s", marketplace, listing_id)
+            elif notifier.send(message):
                 logger.info("Notification sent for %s %s", marketplace, listing_id)
-            # Always mark as seen after attempt
-            seen_store.mark_seen(marketplace, listing_id)
-            # Log JSON payload for persistence
+            # Log JSON payload for persistence; skip serialization
+            # entirely when INFO is disabled
+            if not logger.isEnabledFor(logging.INFO):
+                continue
             payload = {
                 "marketplace": marketplace,
                 "listing_id": listing_id,
-                "title": listing.get("title"),
-                "url": listing.get("url"),
-                "brand": listing.get("brand"),
-                "model": listing.get("model"),
-                "condition": listing.get("condition"),
-                "product_cost": product_cost,
-                "buyer_protection_cost": buyer_protection_cost,
-                "shipping_cost": shipping_cost,
-                "total_cost": total_cost,
-                "potential_resale_value": potential_resale_value,
-                "profit": profit,
-                "margin_percent": margin_percent,
+                **{key: listing.get(key) for key in _LOG_FIELDS},
+                **dict(zip(_COST_FIELDS, breakdown)),
                 "currency": settings.CURRENCY,
-                "timestamp_utc": datetime.utcnow().isoformat(),
+                "timestamp_utc": cycle_ts,
             }
-            logger.info("Payload: %s", json.dumps(payload))
+            logger.info("Payload: %s", orjson.dumps(payload).decode())
+    # Flush everything processed this cycle in one batched write
+    seen_store.mark_seen_many(processed_pairs)
 
 
 async def start_worker() -> None:
     """Continuously run polling cycles at the configured interval."""
     settings = get_settings()
     interval_seconds = max(settings.POLL_INTERVAL, 1) * 60
-    while True:
-        await run_once(settings)
-        await asyncio.sleep(interval_seconds)
+    # Resolve the per-cycle inputs once for the life of the worker
+    keywords = settings.keywords_list
+    regex_include = settings.include_re
+    regex_exclude = settings.exclude_re
+    notifier = WhatsAppNotifier(settings)
+    # One store and notifier for the life of the worker: the SQLite
+    # connection and HTTP session are reused across cycles instead of
+    # being rebuilt every poll
+    seen_store = SeenStore(settings.SQLITE_DB)
+    send_queue: asyncio.Queue = asyncio.Queue()
+    sender_task = asyncio.create_task(_notification_sender(notifier, send_queue))
+    try:
+        while True:
+            # Sleep only for the remainder of the interval so cycle
+            # duration does not drift the polling cadence
+            cycle_start = time.monotonic()
+            await run_once(
+                settings,
+                keywords,
+                regex_include,
+                regex_exclude,
+                send_queue,
+                seen_store=seen_store,
+            )
+            elapsed = time.monotonic() - cycle_start
+            await asyncio.sleep(max(0.0, interval_seconds - elapsed))
+    finally:
+        sender_task.cancel()
+        seen_store.close()
+        await close_async_client()
 
 
 def main() -> None:
     """Entry point for the worker process."""
+    try:  # uvloop is unavailable on Windows; fall back to the default loop
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     try:
         asyncio.run(start_worker())
     except KeyboardInterrupt: